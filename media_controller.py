@@ -1,17 +1,56 @@
 import subprocess
 import curses
 import argparse
+import asyncio
+import hashlib
 import json
 import os
-from mutagen import File
-from mutagen.id3 import ID3NoHeaderError
-import requests
+import random
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+try:
+    # Rust-backed drop-in replacement for mutagen; much faster tag parsing
+    # and caches results by path+mtime, which matters since the curses UI
+    # re-reads metadata frequently.
+    from mutagen_rs import File
+except ImportError:
+    from mutagen import File
+import aiohttp
 import time
 
 # Configuration for Genius API (replace with your actual client access token)
 GENIUS_API_TOKEN = os.environ.get("GENIUS_API_TOKEN")
 GENIUS_API_URL = "https://api.genius.com"
 
+_HOME = os.path.expanduser("~")
+
+def _expand(path):
+    """Cheap os.path.expanduser: the home prefix is resolved once at import."""
+    if path.startswith("~/"):
+        return _HOME + path[1:]
+    if path == "~":
+        return _HOME
+    return path
+
+LYRICS_CACHE_DIR = _expand("~/.termux_media_controller_lyrics")
+LYRICS_NEGATIVE_TTL = 3600  # Re-check "no lyrics found" results after an hour
+
+# Pre-compiled display templates for the curses UI; with the diff draw,
+# rows built from these only re-emit when their fields actually change.
+_HDR = "{status} {artist} - {title} ({elapsed}/{total})"
+_PROGRESS = "Progress: [{bar}] {pct}%"
+_VOLUME = "Volume: [{bar}] {vol}%"
+_MODES = "Shuffle: {shuffle} | Repeat: {repeat}"
+
+def _mmss(seconds):
+    """Format seconds as MM:SS without strftime/struct_time overhead."""
+    seconds = int(seconds)
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+def _lyrics_cache_path(artist, title):
+    digest = hashlib.sha1(f"{artist}|{title}".encode("utf-8")).hexdigest()
+    return os.path.join(LYRICS_CACHE_DIR, f"{digest}.json")
+
 class MediaController:
     def __init__(self):
         self.current_file = ""
@@ -25,9 +64,25 @@ class MediaController:
         self.last_position = 0
         self.playback_start_time = 0
         self.paused_time = 0
-        self.config_file = os.path.expanduser("~/.termux_media_controller_config.json")
+        self.config_file = _expand("~/.termux_media_controller_config.json")
+        self._meta_cache = {}  # (path, mtime) -> metadata dict
+        self._stat_cache = {}  # path -> mtime, to skip repeated stat syscalls
+        self._executor = ThreadPoolExecutor(max_workers=2)  # Metadata prefetch
+        self._lyrics_cache = {}  # (artist, title) lowercased -> (expires, lyrics lines)
+        self._pending_volume = None  # Volume waiting for the debounce window
+        self._last_volume_exec = 0.0
+        self._config_dirty = False
+        self._last_config_flush = 0.0
+        self._last_lines = {}  # row -> last string drawn there by curses_ui
+        # Prebuilt bar glyphs; the UI slices these instead of multiplying
+        # fresh strings every frame.
+        self._full_bar = "█" * 256
+        self._empty_bar = "░" * 256
 
         self.load_config()
+        # Playlist positions map through this index array; shuffling permutes
+        # the indices (cheap, and resetting it restores the original order).
+        self._order = list(range(len(self.playlist)))
 
     def _run_termux_command(self, command, timeout=5, blocking=True):
         try:
@@ -47,34 +102,60 @@ class MediaController:
             print(f"An unexpected error occurred while running command {' '.join(command)}: {e}")
             return None
 
+    def _stat_file(self, path):
+        """Return the file's mtime, or None if it doesn't exist.
+
+        One os.stat covers both the existence check and the mtime, and the
+        result is cached so repeated plays of the same file skip the syscall.
+        """
+        mtime = self._stat_cache.get(path)
+        if mtime is not None:
+            return mtime
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        self._stat_cache[path] = mtime
+        return mtime
+
+    def _track_path(self, index):
+        """Map a playlist position through the shuffle order to a file path."""
+        return self.playlist[self._order[index]]
+
     def play(self, file_path=None):
         if file_path:
-            self.current_file = os.path.expanduser(file_path)
+            self.current_file = _expand(file_path)
             self.current_track_index = -1 # Reset index if playing a specific file
             self.last_position = 0 # Reset position for new file
         elif self.playlist and self.current_track_index != -1:
-            self.current_file = self.playlist[self.current_track_index]
+            self.current_file = self._track_path(self.current_track_index)
         elif not self.current_file:
             print("No file specified to play.")
             return
 
-        if not os.path.exists(self.current_file):
+        if self._stat_file(self.current_file) is None:
             print(f"Error: File not found: {self.current_file}")
             return
 
         print(f"Playing: {self.current_file}")
         self._run_termux_command(["termux-media-player", "play", self.current_file], blocking=False)
         self.is_playing = True
-        self.playback_start_time = time.time() - self.last_position # Account for resuming
+        self.playback_start_time = time.monotonic() - self.last_position # Account for resuming
         self.load_metadata()
         self.send_notification(f"Playing: {self.metadata.get('artist', 'Unknown')} - {self.metadata.get('title', 'Unknown')}")
         self.save_config()
 
+        # Warm the metadata and lyrics caches for the upcoming track in the
+        # background
+        if self.playlist and self.current_track_index != -1:
+            next_path = self._track_path((self.current_track_index + 1) % len(self.playlist))
+            self._executor.submit(self._prefetch_next, next_path)
+
     def pause(self):
         if self.is_playing:
             self._run_termux_command(["termux-media-player", "pause"], blocking=False)
             self.is_playing = False
-            self.paused_time = time.time()
+            self.paused_time = time.monotonic()
             self.last_position += (self.paused_time - self.playback_start_time)
             self.send_notification("Paused")
             self.save_config()
@@ -87,86 +168,156 @@ class MediaController:
             self.send_notification("Stopped")
             self.save_config()
 
-    def next_track(self):
+    def jump_tracks(self, delta):
+        """Move delta tracks forward or back with a single play() call.
+
+        Held next/prev keys coalesce into one jump, so skipping several
+        tracks costs one subprocess spawn instead of one per keypress.
+        """
         if not self.playlist:
             print("No playlist loaded.")
             return
 
-        if self.shuffle_mode:
-            self.current_track_index = (self.current_track_index + 1) % len(self.playlist) # Simple shuffle for now
+        # Detect the end of the playlist before committing the new index, so
+        # stopping doesn't leave the player pointing back at track 0.
+        next_index = self.current_track_index + delta
+        if delta > 0 and next_index >= len(self.playlist):
+            if self.repeat_mode:
+                next_index %= len(self.playlist)
+            else:
+                self.stop()
+                print("Playlist finished.")
+                return
         else:
-            self.current_track_index = (self.current_track_index + 1) % len(self.playlist)
-
-        if self.current_track_index == 0 and not self.repeat_mode:
-            self.stop()
-            print("Playlist finished.")
-            return
+            next_index %= len(self.playlist)
 
+        self.current_track_index = next_index
         self.play()
 
-    def prev_track(self):
-        if not self.playlist:
-            print("No playlist loaded.")
-            return
+    def next_track(self):
+        self.jump_tracks(1)
 
-        self.current_track_index = (self.current_track_index - 1 + len(self.playlist)) % len(self.playlist)
-        self.play()
+    def prev_track(self):
+        self.jump_tracks(-1)
 
-    def load_metadata(self):
+    def _parse_metadata(self, path):
+        # Single success path; any parse failure (missing ID3 header,
+        # unreadable file, ...) gets the same basename fallback.
         try:
-            audio = File(self.current_file)
-            self.metadata = {
-                'title': audio.get('title', ['Unknown Title'])[0],
-                'artist': audio.get('artist', ['Unknown Artist'])[0],
-                'album': audio.get('album', ['Unknown Album'])[0],
-                'duration': audio.info.length if audio.info.length else 0
-            }
-        except ID3NoHeaderError:
-            print(f"No ID3 tags found for {self.current_file}. Trying to extract basic info.")
-            self.metadata = {
-                'title': os.path.basename(self.current_file),
-                'artist': 'Unknown Artist',
-                'album': 'Unknown Album',
-                'duration': 0 # Cannot get duration without proper tags or ffmpeg parsing
+            audio = File(path)
+            get = lambda key, default: (audio.get(key, [default]) or [default])[0]
+            return {
+                'title': get('title', 'Unknown Title'),
+                'artist': get('artist', 'Unknown Artist'),
+                'album': get('album', 'Unknown Album'),
+                'duration': getattr(audio.info, 'length', 0) or 0
             }
         except Exception as e:
-            print(f"Error loading metadata for {self.current_file}: {e}")
-            self.metadata = {
-                'title': os.path.basename(self.current_file),
+            print(f"Error loading metadata for {path}: {e}")
+            return {
+                'title': os.path.basename(path),
                 'artist': 'Unknown Artist',
                 'album': 'Unknown Album',
-                'duration': 0
+                'duration': 0 # Cannot get duration without proper tags or ffmpeg parsing
             }
 
+    def _prefetch_meta(self, path):
+        # Runs in the executor so the parse cost is paid while the current
+        # track plays; load_metadata then hits the cache on track change.
+        mtime = self._stat_file(path)
+        if mtime is None:
+            return
+        key = (path, mtime)
+        if key not in self._meta_cache:
+            self._meta_cache[key] = self._parse_metadata(path)
+
+    def _prefetch_next(self, path):
+        # Warm both caches for the upcoming track while the current one
+        # plays: metadata first, then its lyrics so pressing 'l' right after
+        # a track change is a cache hit instead of two network round-trips.
+        self._prefetch_meta(path)
+        mtime = self._stat_file(path)
+        if mtime is None:
+            return
+        meta = self._meta_cache.get((path, mtime))
+        if meta:
+            self.prefetch_lyrics([(meta['artist'], meta['title'])])
+
+    def load_metadata(self):
+        # Memoize by (path, mtime) so repeated loads of the same file are a
+        # dict lookup instead of a full tag parse.
+        try:
+            key = (self.current_file, os.stat(self.current_file).st_mtime)
+        except OSError:
+            key = None
+        if key is not None:
+            cached = self._meta_cache.get(key)
+            if cached is not None:
+                self.metadata = cached
+                return
+
+        self.metadata = self._parse_metadata(self.current_file)
+
+        if key is not None:
+            self._meta_cache[key] = self.metadata
+
     def get_playback_info(self):
         current_seconds = self.last_position
         total_seconds = self.metadata.get('duration', 0)
 
         if self.is_playing:
-            current_seconds = self.last_position + (time.time() - self.playback_start_time)
+            current_seconds = self.last_position + (time.monotonic() - self.playback_start_time)
             if current_seconds > total_seconds and total_seconds > 0:
                 current_seconds = total_seconds # Cap at total duration
 
         return current_seconds, total_seconds
 
     def set_volume(self, level):
+        # Debounce the termux-volume subprocess: holding the volume keys
+        # updates internal state every event but only forks once per 150 ms.
         self.volume = max(0, min(100, level))
-        self._run_termux_command(["termux-volume", "music", str(self.volume)], blocking=False)
+        now = time.monotonic()
+        if now - self._last_volume_exec > 0.15:
+            self._run_termux_command(["termux-volume", "music", str(self.volume)], blocking=False)
+            self._last_volume_exec = now
+            self._pending_volume = None
+        else:
+            self._pending_volume = self.volume
         self.save_config()
 
-    def get_lyrics(self, artist, title):
-        if not GENIUS_API_TOKEN:
-            print("Genius API token not set. Please set the GENIUS_API_TOKEN environment variable.")
-            return []
-
+    def _flush_pending_volume(self, force=False):
+        if self._pending_volume is None:
+            return
+        now = time.monotonic()
+        if force or now - self._last_volume_exec > 0.15:
+            self._run_termux_command(["termux-volume", "music", str(self._pending_volume)], blocking=False)
+            self._last_volume_exec = now
+            self._pending_volume = None
+
+    async def _genius_get_json(self, session, url, params=None, retries=3, backoff=0.5):
+        # Retry transient failures (rate limits, flaky mobile networks) with
+        # exponential backoff; the shared session keeps the TLS connection
+        # alive across retries and back-to-back calls.
+        for attempt in range(retries):
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status in (429, 502, 503) and attempt < retries - 1:
+                        await asyncio.sleep(backoff * (2 ** attempt))
+                        continue
+                    response.raise_for_status()
+                    return await response.json()
+            except aiohttp.ClientConnectionError:
+                if attempt < retries - 1:
+                    await asyncio.sleep(backoff * (2 ** attempt))
+                    continue
+                raise
+
+    async def _get_lyrics_async(self, session, artist, title):
         search_url = f"{GENIUS_API_URL}/search"
-        headers = {"Authorization": f"Bearer {GENIUS_API_TOKEN}"}
         params = {"q": f"{artist} {title}"}
 
         try:
-            response = requests.get(search_url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._genius_get_json(session, search_url, params=params)
 
             song_id = None
             for hit in data["response"]["hits"]:
@@ -174,13 +325,11 @@ class MediaController:
                    hit["result"]["title"].lower() == title.lower():
                     song_id = hit["result"]["id"]
                     break
-            
+
             if song_id:
                 song_url = f"{GENIUS_API_URL}/songs/{song_id}"
-                song_response = requests.get(song_url, headers=headers)
-                song_response.raise_for_status()
-                song_data = song_response.json()
-                
+                song_data = await self._genius_get_json(session, song_url)
+
                 # Genius API does not provide synchronized lyrics directly.
                 # We would typically scrape the lyrics from the song_data['response']['song']['url']
                 # For this example, we'll just return a placeholder.
@@ -190,26 +339,115 @@ class MediaController:
                 print(f"No lyrics found on Genius for {artist} - {title}")
                 return ["No lyrics found."]
 
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"Error fetching lyrics from Genius API: {e}")
             return ["Error fetching lyrics."]
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
             return ["An unexpected error occurred."]
 
+    def _cached_lyrics(self, artist, title):
+        key = (artist.lower(), title.lower())
+        cached = self._lyrics_cache.get(key)
+        if cached is not None:
+            expires, lyrics = cached
+            if expires is None or expires > time.time():
+                return lyrics
+            del self._lyrics_cache[key]  # TTL elapsed; re-check Genius
+
+        cache_path = _lyrics_cache_path(*key)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r') as f:
+                    entry = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return None
+            expires = entry.get("expires")
+            if expires is None or expires > time.time():
+                lyrics = entry.get("lyrics", [])
+                self._lyrics_cache[key] = (expires, lyrics)
+                return lyrics
+        return None
+
+    def _store_lyrics(self, artist, title, lyrics):
+        # Transient errors are not worth caching; "no lyrics found" is cached
+        # with a short TTL in case Genius indexes the song later.
+        if not lyrics or lyrics[0] in ("Error fetching lyrics.", "An unexpected error occurred."):
+            return
+        expires = time.time() + LYRICS_NEGATIVE_TTL if lyrics == ["No lyrics found."] else None
+
+        key = (artist.lower(), title.lower())
+        self._lyrics_cache[key] = (expires, lyrics)
+        try:
+            os.makedirs(LYRICS_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=LYRICS_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"expires": expires, "lyrics": lyrics}, f)
+            os.replace(tmp_path, _lyrics_cache_path(*key))
+        except OSError as e:
+            print(f"Could not write lyrics cache: {e}")
+
+    def _genius_session(self):
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=8),
+            headers={"Authorization": f"Bearer {GENIUS_API_TOKEN}"},
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+
+    def get_lyrics(self, artist, title):
+        cached = self._cached_lyrics(artist, title)
+        if cached is not None:
+            return cached
+
+        if not GENIUS_API_TOKEN:
+            print("Genius API token not set. Please set the GENIUS_API_TOKEN environment variable.")
+            return []
+
+        async def _fetch():
+            async with self._genius_session() as session:
+                return await self._get_lyrics_async(session, artist, title)
+
+        lyrics = asyncio.run(_fetch())
+        self._store_lyrics(artist, title, lyrics)
+        return lyrics
+
+    def prefetch_lyrics(self, tracks):
+        """Fetch lyrics for several (artist, title) pairs concurrently."""
+        if not GENIUS_API_TOKEN or not tracks:
+            return []
+
+        tracks = [t for t in tracks if self._cached_lyrics(*t) is None]
+        if not tracks:
+            return []
+
+        async def _fetch_all():
+            async with self._genius_session() as session:
+                return await asyncio.gather(
+                    *[self._get_lyrics_async(session, artist, title) for artist, title in tracks]
+                )
+
+        results = asyncio.run(_fetch_all())
+        for (artist, title), lyrics in zip(tracks, results):
+            self._store_lyrics(artist, title, lyrics)
+        return results
+
     def load_playlist(self, playlist_path):
-        playlist_path = os.path.expanduser(playlist_path)
+        playlist_path = _expand(playlist_path)
         if not os.path.exists(playlist_path):
             print(f"Playlist file not found: {playlist_path}")
             return
 
         self.playlist = []
+        base_dir = os.getcwd()  # Resolve once instead of per abspath call
         with open(playlist_path, 'r') as f:
             for line in f:
                 line = line.strip()
                 if line and not line.startswith('#'): # Ignore comments and empty lines
-                    self.playlist.append(os.path.abspath(line)) # Store absolute paths
+                    # Store absolute paths; existence is checked at play time
+                    # so loading a big M3U doesn't stat every entry.
+                    self.playlist.append(os.path.normpath(os.path.join(base_dir, line)))
 
+        self._order = list(range(len(self.playlist)))
         if self.playlist:
             self.current_track_index = 0
             print(f"Loaded playlist with {len(self.playlist)} tracks.")
@@ -218,15 +456,16 @@ class MediaController:
         self.save_config()
 
     def save_playlist(self, playlist_path):
-        playlist_path = os.path.expanduser(playlist_path)
+        playlist_path = _expand(playlist_path)
         with open(playlist_path, 'w') as f:
             for track in self.playlist:
                 f.write(f"{track}\n")
         print(f"Playlist saved to {playlist_path}")
 
     def shuffle_playlist(self):
-        import random
-        random.shuffle(self.playlist)
+        # Shuffle the index array, not the path list: O(N) ints moved instead
+        # of string objects, and the original order stays recoverable.
+        random.shuffle(self._order)
         self.current_track_index = 0
         print("Playlist shuffled.")
         self.save_config()
@@ -238,6 +477,9 @@ class MediaController:
 
     def toggle_shuffle(self):
         self.shuffle_mode = not self.shuffle_mode
+        if not self.shuffle_mode:
+            # Free unshuffle: restore the original playlist order
+            self._order = list(range(len(self.playlist)))
         print(f"Shuffle mode: {'On' if self.shuffle_mode else 'Off'}")
         self.save_config()
 
@@ -260,6 +502,19 @@ class MediaController:
             print("No config file found. Starting with default settings.")
 
     def save_config(self):
+        # Mark dirty and let the debounced flush decide whether to hit disk;
+        # holding a volume key would otherwise rewrite the file dozens of
+        # times per second.
+        self._config_dirty = True
+        self._flush_config()
+
+    def _flush_config(self, force=False):
+        if not self._config_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_config_flush < 1.0:
+            return
+
         config = {
             'current_file': self.current_file,
             'last_position': self.last_position,
@@ -269,15 +524,23 @@ class MediaController:
             'repeat_mode': self.repeat_mode,
             'shuffle_mode': self.shuffle_mode
         }
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f)
+        tmp_path = self.config_file + ".tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(config, f, separators=(",", ":"))
+            os.replace(tmp_path, self.config_file)  # Atomic: no torn writes
+        except OSError as e:
+            print(f"Error saving config: {e}")
+            return
+        self._config_dirty = False
+        self._last_config_flush = now
 
     def resume_playback(self):
-        if self.current_file and os.path.exists(self.current_file):
+        if self.current_file and self._stat_file(self.current_file) is not None:
             print(f"Resuming playback of {self.current_file} from {self.last_position} seconds.")
             self._run_termux_command(["termux-media-player", "play", self.current_file])
             self.is_playing = True
-            self.playback_start_time = time.time() - self.last_position
+            self.playback_start_time = time.monotonic() - self.last_position
             self.load_metadata()
             self.send_notification(f"Playing: {self.metadata.get('artist', 'Unknown')} - {self.metadata.get('title', 'Unknown')}")
             self.save_config()
@@ -296,82 +559,131 @@ class MediaController:
         lyrics_lines = []
         lyrics_scroll_pos = 0
 
+        # Metadata only changes on track change (play/next/prev/resume all
+        # reload it), so load it once up front instead of every refresh.
+        if self.current_file:
+            self.load_metadata()
+
+        self._last_lines.clear()
+        last_size = (0, 0)
+        last_second = None  # Displayed second at the last rebuilt frame
+
         while True:
-            stdscr.clear()
             height, width = stdscr.getmaxyx()
-
-            # Handle input
+            if (height, width) != last_size:
+                # Terminal resized (or first frame): repaint from scratch
+                last_size = (height, width)
+                self._last_lines.clear()
+                stdscr.erase()
+                last_second = None
+
+            # Handle input: drain everything queued this frame so fast key
+            # repeats don't back up behind the 100ms tick.
+            keys = []
             key = stdscr.getch()
-            if key == curses.ERR:
-                key = -1 # No key pressed
-
-            if key == ord('q'):
+            while key != -1 and key != curses.ERR:
+                keys.append(key)
+                key = stdscr.getch()
+
+            quit_requested = False
+            volume_delta = 0  # Fold held Up/Down repeats into one adjustment
+            track_delta = 0   # Likewise for Right/Left: one jump per frame
+            for key in keys:
+                if key == ord('q'):
+                    quit_requested = True
+                    break
+                elif key == ord(' '):
+                    if self.is_playing:
+                        self.pause()
+                    else:
+                        self.play()
+                elif key == curses.KEY_RIGHT:
+                    track_delta += 1
+                elif key == curses.KEY_LEFT:
+                    track_delta -= 1
+                elif key == curses.KEY_UP:
+                    volume_delta += 1
+                elif key == curses.KEY_DOWN:
+                    volume_delta -= 1
+                elif key == ord('s'):
+                    self.toggle_shuffle()
+                elif key == ord('r'):
+                    self.toggle_repeat()
+                elif key == ord('l'):
+                    # Fetch and display lyrics
+                    if self.metadata.get('artist') and self.metadata.get('title'):
+                        lyrics_lines = self.get_lyrics(self.metadata['artist'], self.metadata['title'])
+                        lyrics_scroll_pos = 0
+                    else:
+                        lyrics_lines = ["No metadata available for lyrics."]
+
+            if volume_delta:
+                self.set_volume(self.volume + 5 * volume_delta)
+
+            if track_delta:
+                self.jump_tracks(track_delta)
+
+            if quit_requested:
                 break
-            elif key == ord(' '):
-                if self.is_playing:
-                    self.pause()
-                else:
-                    self.play()
-            elif key == curses.KEY_RIGHT:
-                self.next_track()
-            elif key == curses.KEY_LEFT:
-                self.prev_track()
-            elif key == curses.KEY_UP:
-                self.set_volume(self.volume + 5)
-            elif key == curses.KEY_DOWN:
-                self.set_volume(self.volume - 5)
-            elif key == ord('s'):
-                self.toggle_shuffle()
-            elif key == ord('r'):
-                self.toggle_repeat()
-            elif key == ord('l'):
-                # Fetch and display lyrics
-                if self.metadata.get('artist') and self.metadata.get('title'):
-                    lyrics_lines = self.get_lyrics(self.metadata['artist'], self.metadata['title'])
-                    lyrics_scroll_pos = 0
-                else:
-                    lyrics_lines = ["No metadata available for lyrics."]
-
-            # Display metadata
+
+            # Apply any volume change still waiting out its debounce window,
+            # and any config write past its debounce interval
+            self._flush_pending_volume()
+            self._flush_config()
+
+            # Frame-skip: with no input and the displayed second unchanged,
+            # nothing on screen can differ — skip the rebuild and refresh.
+            # Auto-scrolling lyrics still need every tick.
+            current_pos, total_duration = self.get_playback_info()
+            second = int(current_pos)
+            lyrics_scrolling = bool(lyrics_lines) and len(lyrics_lines) > (height - 7)
+            if not keys and second == last_second and not lyrics_scrolling:
+                stdscr.timeout(100 if self.is_playing else 250)
+                continue
+            last_second = second
+
+            # Build the frame as row -> string, then only redraw rows that
+            # actually changed since the last refresh.
+            frame = {}
             if self.current_file:
-                self.load_metadata() # Refresh metadata in case it changed
-                current_pos, total_duration = self.get_playback_info()
-                
-                status = "[▶]" if self.is_playing else "[⏸]"
-                
-                title_artist = f"{self.metadata.get('artist', 'Unknown')} - {self.metadata.get('title', 'Unknown')}"
-                
-                # Time display
-                elapsed_time = time.strftime('%M:%S', time.gmtime(current_pos))
-                total_time = time.strftime('%M:%S', time.gmtime(total_duration))
-                time_display = f"{elapsed_time}/{total_time}"
-
-                stdscr.addstr(0, 0, f"{status} {title_artist} ({time_display})")
+                frame[0] = _HDR.format_map({
+                    'status': "[▶]" if self.is_playing else "[⏸]",
+                    'artist': self.metadata.get('artist', 'Unknown'),
+                    'title': self.metadata.get('title', 'Unknown'),
+                    'elapsed': _mmss(current_pos),
+                    'total': _mmss(total_duration)
+                })
 
                 # Progress bar
                 if total_duration > 0:
                     progress_percent = current_pos / total_duration
                     bar_length = width - 20 # Adjust bar length based on terminal width
+                    if bar_length > len(self._full_bar):
+                        # Very wide terminal; grow the prebuilt glyph strings
+                        self._full_bar = "█" * bar_length
+                        self._empty_bar = "░" * bar_length
                     filled_length = int(bar_length * progress_percent)
-                    progress_bar = "█" * filled_length + "░" * (bar_length - filled_length)
-                    stdscr.addstr(1, 0, f"Progress: [{progress_bar}] {int(progress_percent*100)}%")
+                    progress_bar = self._full_bar[:filled_length] + self._empty_bar[:bar_length - filled_length]
+                    frame[1] = _PROGRESS.format_map({'bar': progress_bar, 'pct': int(progress_percent*100)})
 
                 # Volume display
                 volume_bar_length = 20
                 filled_volume = int(volume_bar_length * (self.volume / 100))
-                volume_bar = "█" * filled_volume + "░" * (volume_bar_length - filled_volume)
-                stdscr.addstr(2, 0, f"Volume: [{volume_bar}] {self.volume}%")
+                volume_bar = self._full_bar[:filled_volume] + self._empty_bar[:volume_bar_length - filled_volume]
+                frame[2] = _VOLUME.format_map({'bar': volume_bar, 'vol': self.volume})
 
                 # Playback modes
-                stdscr.addstr(3, 0, f"Shuffle: {'On' if self.shuffle_mode else 'Off'} | Repeat: {'On' if self.repeat_mode else 'Off'}")
+                frame[3] = _MODES.format_map({
+                    'shuffle': 'On' if self.shuffle_mode else 'Off',
+                    'repeat': 'On' if self.repeat_mode else 'Off'
+                })
 
                 # Lyrics display
                 if lyrics_lines:
-                    stdscr.addstr(5, 0, "--- Lyrics ---")
+                    frame[5] = "--- Lyrics ---"
                     display_lines = min(height - 7, len(lyrics_lines) - lyrics_scroll_pos)
                     for i in range(display_lines):
-                        line_to_display = lyrics_lines[lyrics_scroll_pos + i]
-                        stdscr.addstr(6 + i, 0, line_to_display[:width-1]) # Truncate to fit width
+                        frame[6 + i] = lyrics_lines[lyrics_scroll_pos + i]
 
                     # Simple scroll for lyrics (for now, just scroll down if more lines than screen height)
                     if len(lyrics_lines) > (height - 7):
@@ -379,10 +691,32 @@ class MediaController:
                         if lyrics_scroll_pos < 0: lyrics_scroll_pos = 0 # Prevent negative index
 
             else:
-                stdscr.addstr(0, 0, "No media loaded. Use 'python media_controller.py <file_or_playlist>'")
-            
+                frame[0] = "No media loaded. Use 'python media_controller.py <file_or_playlist>'"
+
+            # Clear rows that no longer have content (e.g. lyrics dismissed)
+            for row in list(self._last_lines):
+                if row not in frame:
+                    stdscr.move(row, 0)
+                    stdscr.clrtoeol()
+                    del self._last_lines[row]
+
+            for row, line in frame.items():
+                if row >= height:
+                    continue
+                if self._last_lines.get(row) != line:
+                    stdscr.move(row, 0)
+                    stdscr.clrtoeol()
+                    try:
+                        stdscr.addstr(row, 0, line[:width-1]) # Truncate to fit width
+                    except curses.error:
+                        pass
+                    self._last_lines[row] = line
+
             stdscr.refresh()
-            time.sleep(0.1) # Small delay to prevent busy-waiting
+
+            # getch() already blocks for the timeout, so no extra sleep is
+            # needed; tick slower while paused to save battery.
+            stdscr.timeout(100 if self.is_playing else 250)
 
 def main():
     parser = argparse.ArgumentParser(description="Termux Media Controller")
@@ -399,51 +733,59 @@ def main():
 
     controller = MediaController()
 
-    if args.volume is not None:
-        controller.set_volume(args.volume)
+    # The whole body runs under this try so the debounced config state is
+    # force-flushed on every exit path, including the early returns below.
+    try:
+        if args.volume is not None:
+            controller.set_volume(args.volume)
 
-    if args.playlist:
-        controller.load_playlist(args.playlist)
-    
-    if args.shuffle:
-        controller.toggle_shuffle()
+        if args.playlist:
+            controller.load_playlist(args.playlist)
 
-    if args.repeat:
-        controller.toggle_repeat()
+        if args.shuffle:
+            controller.toggle_shuffle()
 
-    if args.path:
-        if args.path.endswith(".m3u"):
-            controller.load_playlist(args.path)
-            controller.play()
-        else:
-            controller.play(args.path)
-    elif args.resume:
-        controller.resume_playback()
-    elif not controller.current_file and not controller.playlist:
-        print("No media specified. Use 'python media_controller.py <file_or_playlist>' or '--resume'.")
-        return
-
-    if args.lyrics:
-        # If --lyrics is used without a UI, just print them
-        if controller.metadata.get('artist') and controller.metadata.get('title'):
-            lyrics = controller.get_lyrics(controller.metadata['artist'], controller.metadata['title'])
-            for line in lyrics:
-                print(line)
-        else:
-            print("No media loaded or metadata available to fetch lyrics.")
-        return # Exit after displaying lyrics if no UI is intended
+        if args.repeat:
+            controller.toggle_repeat()
 
-    if args.save_playlist:
-        controller.save_playlist(args.save_playlist)
-        return # Exit after saving playlist if no UI is intended
+        if args.path:
+            if args.path.endswith(".m3u"):
+                controller.load_playlist(args.path)
+                controller.play()
+            else:
+                controller.play(args.path)
+        elif args.resume:
+            controller.resume_playback()
+        elif not controller.current_file and not controller.playlist:
+            print("No media specified. Use 'python media_controller.py <file_or_playlist>' or '--resume'.")
+            return
 
-    try:
-        curses.wrapper(controller.curses_ui)
-    except curses.error as e:
-        print(f"Curses error: {e}. This might happen if your terminal does not support curses or is too small.")
-        print("Try running without the UI by specifying a file directly or using --lyrics.")
+        if args.lyrics:
+            # If --lyrics is used without a UI, just print them
+            if controller.metadata.get('artist') and controller.metadata.get('title'):
+                lyrics = controller.get_lyrics(controller.metadata['artist'], controller.metadata['title'])
+                for line in lyrics:
+                    print(line)
+            else:
+                print("No media loaded or metadata available to fetch lyrics.")
+            return # Exit after displaying lyrics if no UI is intended
+
+        if args.save_playlist:
+            controller.save_playlist(args.save_playlist)
+            return # Exit after saving playlist if no UI is intended
+
+        try:
+            curses.wrapper(controller.curses_ui)
+        except curses.error as e:
+            print(f"Curses error: {e}. This might happen if your terminal does not support curses or is too small.")
+            print("Try running without the UI by specifying a file directly or using --lyrics.")
+        finally:
+            controller.stop() # Ensure media player is stopped on exit
     finally:
-        controller.stop() # Ensure media player is stopped on exit
+        # Persist any debounced state: a volume change made within the last
+        # 150 ms and config writes still inside their flush window
+        controller._flush_pending_volume(force=True)
+        controller._flush_config(force=True)
 
 if __name__ == "__main__":
     main()